@@ -35,6 +35,8 @@ import logging
 import pathlib
 import re
 import csv
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from src.utils import ensure_directory, create_output_directories, setup_logging
 import argparse
 from typing import Tuple
@@ -54,6 +56,34 @@ required_columns = [
     'Matched'
 ]
 
+# Patterns used when cleaning source values
+DATE_SHAPE_PATTERN = re.compile(r'\d+[/-]\d+[/-]\d+')  # digits separated by / or -
+AMOUNT_SYMBOLS_PATTERN = re.compile(r'[$,]')  # currency symbols and thousands separators
+ISO_DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')  # already in YYYY-MM-DD form
+
+# Raw columns each format's processor reads; other columns in a statement
+# export are skipped while parsing (the standardized 'test' format keeps all)
+FORMAT_COLUMNS = {
+    'discover': ['Trans. Date', 'Post Date', 'Description', 'Amount', 'Category'],
+    'capital_one': ['Transaction Date', 'Posted Date', 'Description', 'Debit', 'Credit', 'Category'],
+    'chase': ['Posting Date', 'Description', 'Amount', 'Type', 'Balance', 'Check or Slip #'],
+    'amex': ['Date', 'Description', 'Amount', 'Category'],
+    'aggregator': ['Date', 'Account', 'Description', 'Amount', 'Category', 'Tags'],
+    'alliant_checking': ['Date', 'Description', 'Amount', 'Balance'],
+    'alliant_visa': ['Date', 'Description', 'Amount', 'Balance', 'Post Date', 'Category'],
+}
+
+# Supported source date formats, in the order they are tried
+DATE_FORMATS = [
+    '%m/%d/%Y',  # US (Chase format)
+    '%Y-%m-%d',  # ISO
+    '%Y-%m-%d %H:%M:%S',  # ISO with time
+    '%m-%d-%Y',  # US with dashes
+    '%Y%m%d',    # Compact
+    '%m%d%Y',    # Compact US
+    '%m/%d/%y'   # Short year
+]
+
 def standardize_date(date_str):
     """
     Convert various date formats to YYYY-MM-DD (ISO8601).
@@ -75,27 +105,33 @@ def standardize_date(date_str):
         
     if not isinstance(date_str, str):
         raise ValueError(f"Date must be a string, got {type(date_str)}")
+    
+    return _standardize_date_text(date_str)
+
+@functools.lru_cache(maxsize=8192)
+def _standardize_date_text(date_str):
+    """
+    Standardize a date string (cached; statements repeat the same dates).
+    
+    Args:
+        date_str (str): Date string to standardize
+        
+    Returns:
+        str: Standardized date in YYYY-MM-DD format
         
+    Raises:
+        ValueError: If the string is not in a supported date format
+    """
     # Remove quotes and extra whitespace
     date_str = date_str.strip().strip('"\'')
     logger.debug(f"Processing date string: {date_str}")
     
     # Check if the string looks like a date (contains at least one digit and one separator)
-    if not re.search(r'\d+[/-]\d+[/-]\d+', date_str):
+    if not DATE_SHAPE_PATTERN.search(date_str):
         raise ValueError(f"Invalid date format: {date_str}")
     
     # Try different date formats
-    formats = [
-        '%m/%d/%Y',  # US (Chase format)
-        '%Y-%m-%d',  # ISO
-        '%Y-%m-%d %H:%M:%S',  # ISO with time
-        '%m-%d-%Y',  # US with dashes
-        '%Y%m%d',    # Compact
-        '%m%d%Y',    # Compact US
-        '%m/%d/%y'   # Short year
-    ]
-    
-    for fmt in formats:
+    for fmt in DATE_FORMATS:
         try:
             logger.debug(f"Trying format {fmt} on {date_str}")
             dt = datetime.strptime(date_str, fmt)
@@ -131,8 +167,24 @@ def clean_amount(amount):
     if not isinstance(amount, str):
         raise ValueError(f"Amount must be string or number, got {type(amount)}")
     
+    return _clean_amount_text(amount)
+
+@functools.lru_cache(maxsize=8192)
+def _clean_amount_text(amount):
+    """
+    Convert an amount string to float (cached; statements repeat amounts).
+    
+    Args:
+        amount (str): Amount text, possibly with currency symbols or parentheses
+        
+    Returns:
+        float: Parsed amount
+        
+    Raises:
+        ValueError: If the text cannot be converted to float
+    """
     # Remove currency symbols, commas, and whitespace
-    cleaned = re.sub(r'[$,]', '', amount.strip())
+    cleaned = AMOUNT_SYMBOLS_PATTERN.sub('', amount.strip())
     
     # Handle parentheses for negative numbers
     if cleaned.startswith('(') and cleaned.endswith(')'):
@@ -145,6 +197,44 @@ def clean_amount(amount):
     except Exception as e:
         raise ValueError(f"Invalid amount format: {amount}")
 
+def clean_amounts(amounts):
+    """Clean and standardize a column of amount values.
+    
+    Args:
+        amounts (pd.Series): Amounts to clean
+        
+    Returns:
+        pd.Series: Cleaned amounts (float64)
+        
+    Raises:
+        ValueError: If any amount cannot be converted to float
+    """
+    if pd.api.types.is_numeric_dtype(amounts):
+        return amounts.astype(float)
+    
+    # Columns without text (e.g. numbers in an object column) keep the scalar path
+    if pd.api.types.infer_dtype(amounts, skipna=True) not in ('string', 'mixed', 'empty'):
+        return amounts.map(clean_amount).astype(float)
+    
+    # Remove currency symbols, commas, and whitespace
+    cleaned = amounts.str.strip().str.replace(AMOUNT_SYMBOLS_PATTERN, '', regex=True)
+    
+    # Handle parentheses for negative numbers
+    parenthesized = cleaned.str.startswith('(', na=False) & cleaned.str.endswith(')', na=False)
+    cleaned = cleaned.mask(parenthesized, '-' + cleaned.str[1:-1])
+    
+    result = pd.Series(
+        pd.to_numeric(cleaned, errors='coerce').to_numpy(dtype=float, na_value=np.nan),
+        index=amounts.index
+    )
+    
+    # Anything left unparsed goes through clean_amount so nulls and invalid
+    # values are handled (and reported) exactly as in the scalar path
+    unresolved = result.isna()
+    if unresolved.any():
+        result[unresolved] = amounts[unresolved].map(clean_amount)
+    return result
+
 def standardize_category(category):
     """
     Standardize transaction category.
@@ -233,6 +323,82 @@ def standardize_description(description):
     # Strip newlines while preserving other content
     return description.replace('\n', ' ')
 
+def standardize_descriptions(descriptions):
+    """
+    Strip newlines from a column of descriptions (vectorized standardize_description).
+    
+    Args:
+        descriptions (pd.Series): Raw transaction descriptions
+        
+    Returns:
+        pd.Series: Descriptions with newlines replaced by spaces; null and
+            non-string values are passed through unchanged
+    """
+    # Mixed or non-text columns keep the scalar path (and its dtype inference)
+    if pd.api.types.infer_dtype(descriptions, skipna=True) != 'string':
+        return descriptions.apply(standardize_description)
+    replaced = descriptions.str.replace('\n', ' ', regex=False)
+    return replaced.where(descriptions.notna(), descriptions)
+
+def parse_dates(dates):
+    """
+    Standardize a column of date strings into datetime64 values.
+    
+    Args:
+        dates (pd.Series): Raw date values
+        
+    Returns:
+        pd.Series: Parsed dates (datetime64[ns])
+        
+    Raises:
+        ValueError: If any date is null, not a string, or invalid format
+    """
+    parsed = pd.Series(pd.NaT, index=dates.index, dtype='datetime64[ns]')
+    
+    # Only columns holding text are parsed column-wise; anything else (e.g.
+    # datetime objects) goes straight to standardize_date and its errors
+    if pd.api.types.infer_dtype(dates, skipna=True) in ('string', 'mixed', 'empty'):
+        # Most exports already use YYYY-MM-DD, so parse those in one pass
+        is_iso = dates.str.match(ISO_DATE_PATTERN, na=False)
+        iso_dates = pd.to_datetime(dates[is_iso], format='%Y-%m-%d', errors='coerce')
+        parsed[is_iso] = iso_dates.where(iso_dates.dt.year.between(1900, 2100))
+        
+        # Try the remaining formats column-wise (with the same cleanup and
+        # year check as standardize_date). Each pass only sees rows that are
+        # still unparsed, and the loop stops once every row is resolved.
+        cleaned = dates.str.strip().str.strip('"\'')
+        candidates = cleaned.str.contains(DATE_SHAPE_PATTERN, na=False)
+        for fmt in DATE_FORMATS:
+            pending = candidates & parsed.isna()
+            if not pending.any():
+                break
+            attempt = pd.to_datetime(cleaned[pending], format=fmt, errors='coerce').dt.normalize()
+            attempt = attempt.where(attempt.dt.year.between(1900, 2100))
+            parsed[pending] = attempt
+    
+    # Everything else goes through standardize_date so other formats and
+    # invalid values are handled (and reported) exactly as in the scalar path.
+    # Statements repeat the same dates a lot, so each distinct value is
+    # standardized only once.
+    unresolved = parsed.isna()
+    if unresolved.any():
+        remaining = dates[unresolved]
+        standardized = {value: standardize_date(value) for value in remaining.unique()}
+        parsed[unresolved] = pd.to_datetime(remaining.map(standardized), format='%Y-%m-%d', cache=True)
+    return parsed
+
+def format_dates(dates):
+    """
+    Format parsed dates as YYYY-MM-DD strings for the standardized output.
+    
+    Args:
+        dates (pd.Series): Parsed dates (datetime64[ns])
+        
+    Returns:
+        pd.Series: Dates in YYYY-MM-DD format
+    """
+    return dates.dt.strftime('%Y-%m-%d')
+
 def process_discover_format(df, source_file=None):
     """Process Discover transactions into standardized format.
     
@@ -253,20 +419,23 @@ def process_discover_format(df, source_file=None):
     result = pd.DataFrame()
     
     # Standardize dates
-    result['Transaction Date'] = df['Trans. Date'].apply(standardize_date)
-    result['Post Date'] = df['Post Date'].apply(standardize_date)
+    transaction_dates = parse_dates(df['Trans. Date'])
+    post_dates = parse_dates(df['Post Date'])
     
     # Validate date order
-    for i, row in result.iterrows():
-        if row['Post Date'] < row['Transaction Date']:
-            raise ValueError("Post date cannot be before transaction date")
+    if (post_dates < transaction_dates).any():
+        raise ValueError("Post date cannot be before transaction date")
+    
+    result['Transaction Date'] = format_dates(transaction_dates)
+    result['Post Date'] = format_dates(post_dates)
     
     # Standardize description (strip newlines)
-    result['Description'] = df['Description'].apply(standardize_description)
+    result['Description'] = standardize_descriptions(df['Description'])
     
     # Standardize amount (negative for debits, positive for credits)
     # Discover uses positive for debits, so we need to invert the sign
-    result['Amount'] = df['Amount'].apply(clean_amount).apply(lambda x: -abs(x) if x > 0 else x)
+    amounts = clean_amounts(df['Amount'])
+    result['Amount'] = amounts.mask(amounts > 0, -amounts)
     
     # Preserve original category without standardization
     result['Category'] = df['Category']
@@ -303,30 +472,29 @@ def process_capital_one_format(df: pd.DataFrame, source_file=None) -> pd.DataFra
     result = pd.DataFrame()
     
     # Standardize dates
-    result['Transaction Date'] = df['Transaction Date'].apply(standardize_date)
-    result['Post Date'] = df['Posted Date'].apply(standardize_date)
+    transaction_dates = parse_dates(df['Transaction Date'])
+    post_dates = parse_dates(df['Posted Date'])
     
     # Validate date order
-    for i, row in result.iterrows():
-        if row['Post Date'] < row['Transaction Date']:
-            raise ValueError("Post date cannot be before transaction date")
+    if (post_dates < transaction_dates).any():
+        raise ValueError("Post date cannot be before transaction date")
+    
+    result['Transaction Date'] = format_dates(transaction_dates)
+    result['Post Date'] = format_dates(post_dates)
     
     # Standardize description (strip newlines)
-    result['Description'] = df['Description'].apply(standardize_description)
+    result['Description'] = standardize_descriptions(df['Description'])
     
     # Preserve Category
     if 'Category' in df.columns:
         result['Category'] = df['Category']
     
     # Clean amounts first, then combine Debit and Credit into single Amount column
-    debit = df['Debit'].apply(clean_amount)
-    credit = df['Credit'].apply(clean_amount)
+    debit = clean_amounts(df['Debit'])
+    credit = clean_amounts(df['Credit'])
     
-    # For each row, if debit is not null, use negative debit; otherwise use positive credit
-    result['Amount'] = df.apply(
-        lambda row: -debit[row.name] if pd.notna(df['Debit'][row.name]) else credit[row.name],
-        axis=1
-    )
+    # If debit is not null, use negative debit; otherwise use positive credit
+    result['Amount'] = (-debit).where(df['Debit'].notna(), credit)
     
     # Add source file if provided
     if source_file is not None:
@@ -361,14 +529,15 @@ def process_chase_format(df: pd.DataFrame, source_file=None) -> pd.DataFrame:
     result = pd.DataFrame()
     
     # Use posting date for both transaction and post dates
-    result['Transaction Date'] = df['Posting Date'].apply(standardize_date)
-    result['Post Date'] = df['Posting Date'].apply(standardize_date)
+    posting_dates = format_dates(parse_dates(df['Posting Date']))
+    result['Transaction Date'] = posting_dates
+    result['Post Date'] = posting_dates
     
     # Standardize description (strip newlines)
-    result['Description'] = df['Description'].apply(standardize_description)
+    result['Description'] = standardize_descriptions(df['Description'])
     
     # Standardize amount (negative for debits, positive for credits)
-    result['Amount'] = df['Amount'].apply(clean_amount)
+    result['Amount'] = clean_amounts(df['Amount'])
     
     # Preserve Type field as separate transaction classification
     result['Type'] = df['Type']
@@ -412,20 +581,21 @@ def process_amex_format(df, source_file=None):
     try:
         # Handle amount (positive values are debits, negative are credits)
         # Invert the sign for standardization (negative for debits, positive for credits)
-        result['Amount'] = df['Amount'].apply(lambda x: -1 * clean_amount(x))
+        result['Amount'] = -clean_amounts(df['Amount'])
     except ValueError as e:
         # Convert amount errors to the format expected by the test
         raise ValueError("Invalid amount format")
     
     try:
         # Then standardize date fields
-        result['Transaction Date'] = df['Date'].apply(standardize_date)
-        result['Post Date'] = df['Date'].apply(standardize_date)  # Use same date for both
+        dates = format_dates(parse_dates(df['Date']))
+        result['Transaction Date'] = dates
+        result['Post Date'] = dates  # Use same date for both
     except ValueError as e:
         raise ValueError(str(e))
     
     # Standardize description
-    result['Description'] = df['Description'].apply(standardize_description)
+    result['Description'] = standardize_descriptions(df['Description'])
     
     # Add Category field - preserve original category values without standardization
     if 'Category' in df.columns:
@@ -462,17 +632,18 @@ def process_aggregator_format(df: pd.DataFrame, source_file=None) -> pd.DataFram
     result = pd.DataFrame()
     
     # Use date for both transaction and post dates
-    result['Transaction Date'] = df['Date'].apply(standardize_date)
-    result['Post Date'] = df['Date'].apply(standardize_date)
+    dates = format_dates(parse_dates(df['Date']))
+    result['Transaction Date'] = dates
+    result['Post Date'] = dates
     
     # Also preserve the original Date column for backward compatibility with tests
-    result['Date'] = df['Date'].apply(standardize_date)
+    result['Date'] = dates
     
     # Standardize description (strip newlines)
-    result['Description'] = df['Description'].apply(standardize_description)
+    result['Description'] = standardize_descriptions(df['Description'])
     
     # Clean and preserve amount
-    result['Amount'] = df['Amount'].apply(clean_amount)
+    result['Amount'] = clean_amounts(df['Amount'])
     
     # Preserve Account (required field)
     result['Account'] = df['Account']
@@ -511,40 +682,30 @@ def process_alliant_checking_format(df, source_file=None):
     
     # Validate and standardize dates
     try:
-        result['Transaction Date'] = df['Date'].apply(standardize_date)
-        result['Post Date'] = df['Date'].apply(standardize_date)  # Use same date for both
+        dates = format_dates(parse_dates(df['Date']))
+        result['Transaction Date'] = dates
+        result['Post Date'] = dates  # Use same date for both
     except ValueError as e:
         raise ValueError(f"Date validation error: {str(e)}")
     
     # Copy description as-is
-    result['Description'] = df['Description'].apply(standardize_description)
+    result['Description'] = standardize_descriptions(df['Description'])
     
     # Process amounts - detect sign and preserve it correctly
     # According to README: positive values in source file are credits/deposits
-    amounts = []
-    for amt in df['Amount']:
-        # Robust check for negative value in source file
-        is_negative = False
-        if isinstance(amt, str):
-            amt_str = amt.strip()
-            if amt_str.startswith('-'):
-                is_negative = True
-            elif '(' in amt_str and ')' in amt_str:
-                is_negative = True
-        elif isinstance(amt, (int, float)) and amt < 0:
-            is_negative = True
-        
-        # Clean the amount to remove $ and commas
-        cleaned_amt = clean_amount(amt)
-        
-        # For standardized format: 
-        # - Negative for debits (payments)
-        # - Positive for credits (deposits)
-        # Per README: Alliant Checking source file has positive values for deposits
-        final_amt = -abs(cleaned_amt) if is_negative else abs(cleaned_amt)
-        amounts.append(final_amt)
+    amounts = clean_amounts(df['Amount'])
+    
+    # A leading minus or parentheses in the source value marks a debit
+    raw = df['Amount'].astype(str).str.strip()
+    is_negative = raw.str.startswith('-') | (
+        raw.str.contains('(', regex=False) & raw.str.contains(')', regex=False)
+    )
     
-    result['Amount'] = amounts
+    # For standardized format: 
+    # - Negative for debits (payments)
+    # - Positive for credits (deposits)
+    magnitude = amounts.abs()
+    result['Amount'] = magnitude.mask(is_negative, -magnitude)
     
     # Ensure Category field exists
     result['Category'] = 'Uncategorized'
@@ -578,27 +739,25 @@ def process_alliant_visa_format(df, source_file=None):
     result = pd.DataFrame()
     
     # Standardize dates
-    result['Transaction Date'] = df['Date'].apply(standardize_date)
-    result['Post Date'] = df['Post Date'].apply(standardize_date)
+    transaction_dates = parse_dates(df['Date'])
+    post_dates = parse_dates(df['Post Date'])
     
     # Validate date order
-    for i, row in result.iterrows():
-        if row['Post Date'] < row['Transaction Date']:
-            raise ValueError("Post date cannot be before transaction date")
+    if (post_dates < transaction_dates).any():
+        raise ValueError("Post date cannot be before transaction date")
+    
+    result['Transaction Date'] = format_dates(transaction_dates)
+    result['Post Date'] = format_dates(post_dates)
     
     # Preserve description exactly as-is (including newlines)
     result['Description'] = df['Description']
     
     # Standardize amount (negative for debits, positive for credits)
     # According to README: "Amount sign convention: negative for debits, positive for credits"
-    def fix_amount(val):
-        amt = clean_amount(val)
-        # Per the README, Alliant Visa amounts should already be negative for debits and positive for credits
-        # However, test data indicates positive values are debits, so we need to negate them
-        if amt > 0:
-            return -amt
-        return amt
-    result['Amount'] = df['Amount'].apply(fix_amount)
+    # Per the README, Alliant Visa amounts should already be negative for debits and positive for credits
+    # However, test data indicates positive values are debits, so we need to negate them
+    amounts = clean_amounts(df['Amount'])
+    result['Amount'] = amounts.mask(amounts > 0, -amounts)
     
     # Preserve Category if present
     if 'Category' in df.columns:
@@ -619,6 +778,115 @@ def process_alliant_visa_format(df, source_file=None):
     
     return result
 
+def format_key_amounts(amounts):
+    """
+    Format absolute amounts for use in reconciliation keys.
+    
+    Amounts are scaled to whole cents (int64) before formatting, so equal
+    currency amounts always produce identical keys.
+    
+    Args:
+        amounts (pd.Series): Transaction amounts
+        
+    Returns:
+        pd.Series: Absolute amounts as 'dollars.cents' strings
+    """
+    values = np.abs(amounts.to_numpy(dtype=float))
+    finite = np.isfinite(values)
+    cents = pd.Series(np.rint(np.where(finite, values, 0) * 100).astype(np.int64), index=amounts.index)
+    keys = (cents // 100).astype(str) + '.' + (cents % 100).astype(str).str.zfill(2)
+    
+    # Missing/infinite amounts keep their usual float formatting ('nan', 'inf')
+    if not finite.all():
+        keys[~finite] = [f"{value:.2f}" for value in values[~finite]]
+    return keys
+
+def format_key_dates(dates):
+    """
+    Format date values as text for use in reconciliation keys.
+    
+    Args:
+        dates (pd.Series): Date values (usually YYYY-MM-DD strings)
+        
+    Returns:
+        pd.Series: Dates as strings (object dtype, even when empty)
+    """
+    return dates.map(str).astype(object)
+
+def encode_key_pairs(date_keys, amount_keys):
+    """
+    Encode (date, amount) key texts as single integers.
+    
+    Args:
+        date_keys (list): Arrays of date key text
+        amount_keys (list): Arrays of amount key text, aligned with date_keys
+        
+    Returns:
+        list: int64 arrays aligned with the inputs; two pairs get the same
+            code exactly when both their date and amount texts are equal
+    """
+    date_codes, _ = pd.factorize(np.concatenate(date_keys))
+    amount_codes, amount_values = pd.factorize(np.concatenate(amount_keys))
+    codes = date_codes.astype(np.int64) * max(len(amount_values), 1) + amount_codes
+    return np.split(codes, np.cumsum([len(keys) for keys in date_keys])[:-1])
+
+def column_values(df, column, default=None):
+    """
+    Get a column as an object array, or a constant array if it is missing.
+    
+    Args:
+        df (pd.DataFrame): Source DataFrame
+        column (str): Column name
+        default: Value used for every row when the column is absent
+        
+    Returns:
+        np.ndarray: Column values (object dtype), one per row
+    """
+    if column in df.columns:
+        return df[column].to_numpy(dtype=object)
+    return np.full(len(df), default, dtype=object)
+
+def match_key_codes(agg_key_codes, entry_starts, entry_groups, n_groups):
+    """
+    Greedily match aggregator key codes against the detail key index.
+    
+    Aggregator rows are matched in order: each row tries its key codes in
+    turn and takes the first detail entry under that code whose row group
+    (detail frame and index label) has not been matched yet. Groups are never
+    unmatched, so a per-code cursor skips entries that are already used.
+    
+    Args:
+        agg_key_codes (list): Per aggregator row, the key codes to try in
+            order (-1 for a key with no detail entries)
+        entry_starts (list): Offsets into entry_groups; code c owns entries
+            entry_starts[c] to entry_starts[c + 1]
+        entry_groups (list): Row group of each detail entry, ordered by code
+        n_groups (int): Number of distinct row groups
+        
+    Returns:
+        tuple: (matched_entries, group_matched) where matched_entries holds
+            the matched entry position per aggregator row (-1 if unmatched)
+            and group_matched flags each row group that was used
+    """
+    cursors = list(entry_starts)
+    group_matched = [False] * n_groups
+    matched_entries = []
+    for codes in agg_key_codes:
+        matched_entry = -1
+        for code in codes:
+            if code < 0:
+                continue
+            pos, end = cursors[code], entry_starts[code + 1]
+            while pos < end and group_matched[entry_groups[pos]]:
+                pos += 1
+            cursors[code] = pos
+            if pos < end:
+                matched_entry = pos
+                group_matched[entry_groups[pos]] = True
+                break
+        matched_entries.append(matched_entry)
+    return matched_entries, group_matched
+
 def reconcile_transactions(aggregator_df, detail_dfs):
     """Reconcile transactions between aggregator and detail DataFrames.
     Args:
@@ -627,114 +895,168 @@ def reconcile_transactions(aggregator_df, detail_dfs):
     Returns:
         tuple: (matched_df, unmatched_df)
     """
-    matched = []
-    unmatched = []
-    matched_detail_keys = set()  # Use a set instead of a dictionary
-    matched_agg_keys = set()     # Use a set instead of a dictionary
 
-    # Build detail key index for fast lookup
-    detail_key_index = {}
+    # Amounts are keyed in whole cents (see format_key_amounts)
+    detail_amount_keys = [format_key_amounts(detail_df['Amount']) for detail_df in detail_dfs]
+    agg_amount_keys = format_key_amounts(aggregator_df['Amount'])
+
+    # Generate aggregator keys column-wise - Post Date first if available,
+    # with Transaction Date always included as a fallback
+    agg_post_dates = aggregator_df.get('Post Date', pd.Series(None, index=aggregator_df.index, dtype=object))
+    agg_post_text = format_key_dates(agg_post_dates)
+    agg_trans_text = format_key_dates(aggregator_df['Transaction Date'])
+    agg_post_keys = 'P:' + agg_post_text + '_' + agg_amount_keys
+    agg_trans_keys = 'P:' + agg_trans_text + '_' + agg_amount_keys
+    agg_has_post_date = agg_post_dates.notna()
+
+    # Build the detail key index. Aggregator keys always carry the P: prefix,
+    # so only detail Post Date (P:) keys can match them and Transaction Date
+    # (T:) keys are not indexed. Each entry records its source frame, row
+    # position and row group, where a row group is one (detail_df_idx, index
+    # label) pair.
+    detail_groups = []
+    entry_dates = [agg_post_text.to_numpy(), agg_trans_text.to_numpy()]
+    entry_amounts = [agg_amount_keys.to_numpy(), agg_amount_keys.to_numpy()]
+    entry_frames = [np.empty(0, dtype=np.intp)]
+    entry_positions = [np.empty(0, dtype=np.intp)]
+    entry_groups = [np.empty(0, dtype=np.intp)]
+    n_groups = 0
     for detail_df_idx, detail_df in enumerate(detail_dfs):
-        for idx, row in detail_df.iterrows():
-            # Try both Post Date and Transaction Date for detail records
-            keys = []
-            if pd.notna(row.get('Post Date', None)):
-                keys.append(f"P:{row['Post Date']}_{abs(row['Amount']):.2f}")
-            if pd.notna(row.get('Transaction Date', None)):
-                keys.append(f"T:{row['Transaction Date']}_{abs(row['Amount']):.2f}")
-            for key in keys:
-                detail_key_index.setdefault(key, []).append((detail_df_idx, idx, row))
+        groups, labels = pd.factorize(detail_df.index, use_na_sentinel=False)
+        detail_groups.append(groups + n_groups)
+        n_groups += len(labels)
+        if 'Post Date' not in detail_df.columns:
+            continue
+        dates = detail_df['Post Date']
+        positions = np.flatnonzero(dates.notna().to_numpy())
+        entry_dates.append(format_key_dates(dates).to_numpy()[positions])
+        entry_amounts.append(detail_amount_keys[detail_df_idx].to_numpy()[positions])
+        entry_frames.append(np.full(len(positions), detail_df_idx))
+        entry_positions.append(positions)
+        entry_groups.append(detail_groups[-1][positions])
+
+    # Compare keys as integers: date and amount texts are factorized jointly
+    # for both sides, so equal (date, amount) pairs get equal codes
+    agg_post_codes, agg_trans_codes, *detail_codes = encode_key_pairs(entry_dates, entry_amounts)
+
+    # Number the distinct detail keys and order entries by key; the stable
+    # sort keeps entries for the same key in insertion order
+    entry_codes, key_values = pd.factorize(np.concatenate([np.empty(0, dtype=np.int64)] + detail_codes))
+    order = np.argsort(entry_codes, kind='stable')
+    entry_codes = entry_codes[order]
+    entry_starts = np.searchsorted(entry_codes, np.arange(len(key_values) + 1)).tolist()
+    entry_frames = np.concatenate(entry_frames)[order]
+    entry_positions = np.concatenate(entry_positions)[order]
+    entry_groups = np.concatenate(entry_groups)[order].tolist()
+    key_index = pd.Index(key_values)
+    agg_post_codes = key_index.get_indexer(agg_post_codes)
+    agg_trans_codes = key_index.get_indexer(agg_trans_codes)
 
     # Match aggregator records to detail records
-    for agg_idx, agg_row in aggregator_df.iterrows():
-        # Generate keys for matching - try Post Date first if available, then Transaction Date
-        agg_keys = []
-        if pd.notna(agg_row.get('Post Date', None)):
-            agg_keys.append(f"P:{agg_row['Post Date']}_{abs(agg_row['Amount']):.2f}")
-        # Always include Transaction Date as a fallback
-        agg_keys.append(f"P:{agg_row['Transaction Date']}_{abs(agg_row['Amount']):.2f}")
-            
-        match_found = False
-        # Try each key for matching
-        for agg_key in agg_keys:
-            if match_found:
-                break
-                
-            if agg_key in detail_key_index:
-                for detail_df_idx, idx, detail_row in detail_key_index[agg_key]:
-                    # Only match if not already matched
-                    if (detail_df_idx, idx) not in matched_detail_keys:
-                        # Prioritize aggregator fields, only use detail fields if aggregator field is null/empty
-                        matched_record = {
-                            'Transaction Date': agg_row['Transaction Date'],
-                            'YearMonth': agg_row['Transaction Date'][:7],
-                            'Account': agg_row.get('Account', detail_row.get('source_file', '')),
-                            'Description': agg_row.get('Description') if pd.notna(agg_row.get('Description')) else detail_row.get('Description', ''),
-                            'Category': agg_row.get('Category') if pd.notna(agg_row.get('Category')) else detail_row.get('Category', ''),
-                            'Tags': agg_row.get('Tags', ''),
-                            'Amount': agg_row.get('Amount') if pd.notna(agg_row.get('Amount')) else detail_row.get('Amount', 0),
-                            'reconciled_key': agg_key,
-                            'Matched': True
-                        }
-                        matched.append(matched_record)
-                        matched_detail_keys.add((detail_df_idx, idx))
-                        matched_agg_keys.add(agg_idx)
-                        match_found = True
-                        break
-                        
-        if not match_found:
-            # Unmatched aggregator record - use the first key generated
-            unmatched_key = agg_keys[0] if agg_keys else f"U:{agg_row['Transaction Date']}_{abs(agg_row['Amount']):.2f}"
-            unmatched_record = {
-                'Transaction Date': agg_row['Transaction Date'],
-                'YearMonth': agg_row['Transaction Date'][:7],
-                'Account': agg_row.get('Account', agg_row.get('source_file', '')),
-                'Description': agg_row['Description'],
-                'Category': agg_row.get('Category', ''),
-                'Tags': agg_row.get('Tags', ''),
-                'Amount': agg_row['Amount'],
-                'reconciled_key': unmatched_key.replace('P:', 'U:').replace('T:', 'U:'),
-                'Matched': False
-            }
-            unmatched.append(unmatched_record)
+    matched_entries, group_matched = match_key_codes(
+        [(post_code, trans_code) if has_post_date else (trans_code,)
+         for has_post_date, post_code, trans_code in zip(
+             agg_has_post_date.tolist(), agg_post_codes.tolist(), agg_trans_codes.tolist())],
+        entry_starts, entry_groups, n_groups
+    )
+    group_matched = np.array(group_matched, dtype=bool)
+
+    # Materialize results column-wise from the matched positions rather than
+    # building one dict per row
+    matched_entries = np.array(matched_entries, dtype=np.intp)
+    is_matched = matched_entries >= 0
+    entries = matched_entries[is_matched]
+    detail_offsets = np.cumsum([0] + [len(detail_df) for detail_df in detail_dfs])
+    detail_rows = (detail_offsets[entry_frames] + entry_positions)[entries]
+
+    def detail_values(column, default):
+        return np.concatenate([np.empty(0, dtype=object)] + [
+            column_values(detail_df, column, default) for detail_df in detail_dfs
+        ])[detail_rows]
+
+    def agg_values(column, default=None, rows=is_matched):
+        return column_values(aggregator_df, column, default)[rows]
+
+    # Prioritize aggregator fields, only use detail fields if aggregator field is null/empty
+    agg_amounts = agg_values('Amount')
+    agg_descriptions = agg_values('Description')
+    agg_categories = agg_values('Category')
+    matched = {
+        'Transaction Date': agg_values('Transaction Date'),
+        'Account': agg_values('Account') if 'Account' in aggregator_df.columns else detail_values('source_file', ''),
+        'Description': np.where(pd.notna(agg_descriptions), agg_descriptions, detail_values('Description', '')),
+        'Category': np.where(pd.notna(agg_categories), agg_categories, detail_values('Category', '')),
+        'Tags': agg_values('Tags', ''),
+        'Amount': np.where(pd.notna(agg_amounts), agg_amounts, detail_values('Amount', 0)),
+        'reconciled_key': np.where(
+            agg_has_post_date.to_numpy()[is_matched] & (agg_post_codes[is_matched] == entry_codes[entries]),
+            agg_post_keys.to_numpy()[is_matched], agg_trans_keys.to_numpy()[is_matched]
+        ),
+        'Matched': np.full(len(entries), True)
+    }
+
+    unmatched = []
+
+    # Unmatched aggregator records - use the first key generated
+    if (~is_matched).any():
+        unmatched_rows = ~is_matched
+        unmatched_keys = agg_post_keys.where(agg_has_post_date, agg_trans_keys)[unmatched_rows]
+        unmatched.append({
+            'Transaction Date': agg_values('Transaction Date', rows=unmatched_rows),
+            'Account': agg_values('Account' if 'Account' in aggregator_df.columns else 'source_file', '', rows=unmatched_rows),
+            'Description': aggregator_df['Description'].to_numpy(dtype=object)[unmatched_rows],
+            'Category': agg_values('Category', '', rows=unmatched_rows),
+            'Tags': agg_values('Tags', '', rows=unmatched_rows),
+            'Amount': agg_values('Amount', rows=unmatched_rows),
+            'reconciled_key': unmatched_keys.str.replace('P:', 'U:', regex=False).str.replace('T:', 'U:', regex=False).to_numpy(),
+            'Matched': np.full(unmatched_rows.sum(), False)
+        })
 
     # Add unmatched detail records
     for detail_df_idx, detail_df in enumerate(detail_dfs):
-        for idx, row in detail_df.iterrows():
-            if (detail_df_idx, idx) not in matched_detail_keys:
-                # Prefer Post Date for unmatched key if available
-                if pd.notna(row.get('Post Date', None)):
-                    key = f"U:{row['Post Date']}_{abs(row['Amount']):.2f}"
-                    date = row['Post Date']
-                else:
-                    key = f"U:{row['Transaction Date']}_{abs(row['Amount']):.2f}"
-                    date = row['Transaction Date']
-                unmatched_record = {
-                    'Transaction Date': date,
-                    'YearMonth': date[:7],
-                    'Account': row.get('source_file', ''),
-                    'Description': row['Description'],  # Preserve original description
-                    'Category': row.get('Category', ''),
-                    'Tags': row.get('Tags', ''),  # Ensure Tags field exists but is empty by default
-                    'Amount': row['Amount'],  # Preserve original amount
-                    'reconciled_key': key,
-                    'Matched': False
-                }
-                unmatched.append(unmatched_record)
+        is_remaining = ~group_matched[detail_groups[detail_df_idx]]
+        remaining = detail_df[is_remaining]
+        if remaining.empty:
+            continue
+        
+        # Prefer Post Date for unmatched key if available
+        post_dates = remaining.get('Post Date', pd.Series(None, index=remaining.index, dtype=object))
+        dates = post_dates.where(post_dates.notna(), remaining['Transaction Date'])
+        keys = 'U:' + format_key_dates(dates) + '_' + detail_amount_keys[detail_df_idx][is_remaining]
+        
+        unmatched.append({
+            'Transaction Date': dates.to_numpy(dtype=object),
+            'Account': column_values(remaining, 'source_file', ''),
+            'Description': remaining['Description'].to_numpy(dtype=object),  # Preserve original description
+            'Category': column_values(remaining, 'Category', ''),
+            'Tags': column_values(remaining, 'Tags', ''),  # Ensure Tags field exists but is empty by default
+            'Amount': remaining['Amount'].to_numpy(dtype=object),  # Preserve original amount
+            'reconciled_key': keys.to_numpy(dtype=object),
+            'Matched': np.full(len(remaining), False)
+        })
 
     # Create DataFrames with consistent columns, even if empty
     columns = ['Transaction Date', 'YearMonth', 'Account', 'Description', 'Category', 
                'Tags', 'Amount', 'reconciled_key', 'Matched']
     
-    if matched:
-        matched_df = pd.DataFrame(matched)
+    if len(entries):
+        matched_df = pd.DataFrame({column: values.tolist() for column, values in matched.items()})
     else:
         matched_df = pd.DataFrame(columns=columns)
     
     if unmatched:
-        unmatched_df = pd.DataFrame(unmatched)
+        unmatched_df = pd.DataFrame({
+            column: [value for part in unmatched for value in part[column].tolist()]
+            for column in unmatched[0]
+        })
     else:
         unmatched_df = pd.DataFrame(columns=columns)
+    
+    # Derive YearMonth once per frame instead of slicing each record
+    for df in (matched_df, unmatched_df):
+        if 'YearMonth' not in df.columns:
+            dates = pd.to_datetime(df['Transaction Date'], format='%Y-%m-%d', errors='coerce')
+            df.insert(1, 'YearMonth', dates.dt.to_period('M').astype(str))
         
     # Ensure Tags field exists in all DataFrames
     if 'Tags' not in matched_df.columns:
@@ -788,11 +1110,62 @@ def identify_format(df):
     # If we get here, the format is unknown
     raise ValueError(f"Unknown file format: {df.columns.tolist()}")
 
-def import_csv(file_path):
+def format_column_filter(format_type):
+    """
+    Build a read_csv usecols filter for an identified format.
+    
+    Args:
+        format_type (str): Format identifier returned by identify_format
+        
+    Returns:
+        callable or None: Filter accepting the columns in FORMAT_COLUMNS for the
+            format (ignoring surrounding whitespace), or None to keep every column
+    """
+    if format_type not in FORMAT_COLUMNS:
+        return None
+    columns = frozenset(FORMAT_COLUMNS[format_type])
+    return lambda column: column.strip() in columns
+
+def read_chase_csv(f):
+    """Read a Chase export (unquoted header row, quoted data rows).
+    
+    Args:
+        f (file-like): Open text file positioned at the header row
+        
+    Returns:
+        pd.DataFrame: Raw Chase rows with stripped column names
+        
+    Raises:
+        ValueError: If no valid data rows are found
+    """
+    reader = csv.reader(f, delimiter=',', quotechar='"', quoting=csv.QUOTE_MINIMAL)
+    header_cols = next(reader)
+    rows = []
+    for idx, row in enumerate(reader):
+        # Skip empty rows
+        if not any(cell.strip() for cell in row):
+            continue
+        if len(row) == len(header_cols):
+            rows.append(row)
+        elif len(row) == len(header_cols) + 1 and row[-1].strip() == '':
+            # Accept row with trailing comma (extra empty column)
+            rows.append(row[:-1])
+        else:
+            logger.warning(f"[Chase CSV Import] Skipping malformed row {idx+2}: {row} (len={len(row)})")
+            continue
+    if not rows:
+        raise ValueError("No valid data rows found in Chase file")
+    df = pd.DataFrame(rows, columns=[col.strip() for col in header_cols])
+    logger.debug(f"[Chase CSV Import] First 3 rows after import:\n{df.head(3).to_string()}")
+    return df
+
+def import_csv(file_path, source_file=None):
     """Import a CSV file and process it based on its format.
     
     Args:
-        file_path (str): Path to the CSV file
+        file_path (str, Path or file-like): Path to the CSV file, or an open text buffer
+        source_file (str, optional): Source file name to record. Defaults to the
+            file's base name (or the buffer's name attribute).
         
     Returns:
         pd.DataFrame: Processed transaction data in standardized format
@@ -800,62 +1173,63 @@ def import_csv(file_path):
     Raises:
         ValueError: If file cannot be read or format is unknown
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
-        
-    # Check if path is a directory
-    if os.path.isdir(file_path):
-        raise ValueError("Path is a directory")
-        
-    # Check if file has a supported extension
-    _, ext = os.path.splitext(file_path)
-    if ext.lower() not in ['.csv', '.xlsx']:
-        raise ValueError("Unsupported file format")
+    # Already-open text buffers are read directly (no path checks or re-encoding)
+    is_buffer = hasattr(file_path, 'read')
+    
+    if not is_buffer:
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+            
+        # Check if path is a directory
+        if os.path.isdir(file_path):
+            raise ValueError("Path is a directory")
+            
+        # Check if file has a supported extension
+        _, ext = os.path.splitext(file_path)
+        if ext.lower() not in ['.csv', '.xlsx']:
+            raise ValueError("Unsupported file format")
+    
+    # Get source file name (preserved exactly as-is)
+    if source_file is None:
+        source_file = getattr(file_path, 'name', '') if is_buffer else os.path.basename(file_path)
     
     try:
         logger.debug(f"Reading file: {file_path}")
         
         # Check if file is empty
-        if os.path.getsize(file_path) == 0:
+        if not is_buffer and os.path.getsize(file_path) == 0:
             raise ValueError("Could not read CSV file with any supported encoding: File is empty")
             
-        # Try different encodings
-        encodings = ['utf-8', 'utf-8-sig', 'cp1252']
+        # Try different encodings (text buffers are already decoded)
+        encodings = ['utf-8'] if is_buffer else ['utf-8', 'utf-8-sig', 'cp1252']
         df = None
         for encoding in encodings:
             try:
                 # Special handling for Chase files with unquoted header and quoted data
-                if os.path.basename(file_path).lower().startswith('chase'):
-                    import csv as pycsv
-                    with open(file_path, 'r', encoding=encoding, newline='') as f:
-                        reader = pycsv.reader(f, delimiter=',', quotechar='"', quoting=pycsv.QUOTE_MINIMAL)
-                        header_cols = next(reader)
-                        rows = []
-                        for idx, row in enumerate(reader):
-                            # Skip empty rows
-                            if not any(cell.strip() for cell in row):
-                                continue
-                            if len(row) == len(header_cols):
-                                rows.append(row)
-                            elif len(row) == len(header_cols) + 1 and row[-1].strip() == '':
-                                # Accept row with trailing comma (extra empty column)
-                                rows.append(row[:-1])
-                            else:
-                                print(f"[Chase CSV Import] Skipping malformed row {idx+2}: {row} (len={len(row)})")
-                                continue
-                    if not rows:
-                        raise ValueError("No valid data rows found in Chase file")
-                    df = pd.DataFrame(rows, columns=[col.strip() for col in header_cols])
-                    print("[Chase CSV Import] First 3 rows after import:")
-                    print(df.head(3).to_string())
+                if source_file.lower().startswith('chase'):
+                    if is_buffer:
+                        df = read_chase_csv(file_path)
+                    else:
+                        with open(file_path, 'r', encoding=encoding, newline='') as f:
+                            df = read_chase_csv(f)
+                    format_type = identify_format(df)
                 else:
+                    # Identify the format from the full header, then parse only
+                    # the columns that format uses
+                    position = file_path.tell() if is_buffer else None
+                    header = pd.read_csv(file_path, header=0, nrows=0, skipinitialspace=True, encoding=encoding)
+                    format_type = identify_format(header)
+                    if is_buffer:
+                        file_path.seek(position)
                     df = pd.read_csv(
                         file_path,
                         header=0,  # First row is header
                         dtype=str,  # Read all columns as strings initially
                         skipinitialspace=True,  # Skip spaces after delimiter
+                        usecols=format_column_filter(format_type),  # Never materialize unused columns
                         encoding=encoding
                     )
+                    df.columns = df.columns.str.strip()
                 logger.debug(f"Successfully read file with encoding: {encoding}")
                 break
             except (UnicodeDecodeError, pd.errors.EmptyDataError) as e:
@@ -866,11 +1240,6 @@ def import_csv(file_path):
         if df is None:
             raise ValueError("Could not read CSV file with any supported encoding")
         
-        # Get source file name (preserved exactly as-is)
-        source_file = os.path.basename(file_path)
-        
-        # Identify format based on structure
-        format_type = identify_format(df)
         logger.debug(f"Identified format: {format_type}")
         
         # Process based on identified format
@@ -898,7 +1267,7 @@ def import_csv(file_path):
         return result
         
     except Exception as e:
-        raise ValueError(f"Error processing {file_path}: {str(e)}")
+        raise ValueError(f"Error processing {source_file if is_buffer else file_path}: {str(e)}")
 
 def import_folder(folder_path):
     """
@@ -935,11 +1304,16 @@ def import_folder(folder_path):
     
     logger.info(f"Importing folder: {folder_path}")
     
-    # Import each file
+    # Import files concurrently (pandas' CSV parser releases the GIL while
+    # tokenizing); results are still collected in sorted file order
+    files = sorted(files)  # Sort for consistent order
+    with ThreadPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as executor:
+        futures = [executor.submit(import_csv, file_path) for file_path in files]
+    
     dfs = []
-    for file_path in sorted(files):  # Sort for consistent order
+    for file_path, future in zip(files, futures):
         try:
-            df = import_csv(file_path)
+            df = future.result()
             if isinstance(df, pd.DataFrame) and not df.empty:
                 dfs.append(df)
             else:
@@ -967,26 +1341,29 @@ def save_reconciliation_results(matched_df, unmatched_df, output_path):
         'Category', 'Tags', 'Amount', 'reconciled_key', 'Matched'
     ]
     
-    # Create deep copies to avoid modifying the original dataframes
-    matched_copy = matched_df.copy() if not matched_df.empty else pd.DataFrame()
-    unmatched_copy = unmatched_df.copy() if not unmatched_df.empty else pd.DataFrame()
+    # rename/assign return new frames, so the original dataframes are never
+    # modified and no up-front deep copy is needed (cheap under copy-on-write)
+    matched_out = pd.DataFrame()
+    unmatched_out = pd.DataFrame()
     
     # Process matched transactions
-    if not matched_copy.empty:
-        if 'Transaction Date' in matched_copy.columns and 'Date' not in matched_copy.columns:
-            matched_copy = matched_copy.rename(columns={'Transaction Date': 'Date'})
+    if not matched_df.empty:
+        matched_out = matched_df
+        if 'Transaction Date' in matched_out.columns and 'Date' not in matched_out.columns:
+            matched_out = matched_out.rename(columns={'Transaction Date': 'Date'})
         # Use string "True" (not boolean) to maintain consistent data types
-        matched_copy['Matched'] = "True"
+        matched_out = matched_out.assign(Matched="True")
     
     # Process unmatched transactions
-    if not unmatched_copy.empty:
-        if 'Transaction Date' in unmatched_copy.columns and 'Date' not in unmatched_copy.columns:
-            unmatched_copy = unmatched_copy.rename(columns={'Transaction Date': 'Date'})
+    if not unmatched_df.empty:
+        unmatched_out = unmatched_df
+        if 'Transaction Date' in unmatched_out.columns and 'Date' not in unmatched_out.columns:
+            unmatched_out = unmatched_out.rename(columns={'Transaction Date': 'Date'})
         # Use string "False" (not boolean) to maintain consistent data types
-        unmatched_copy['Matched'] = "False"
+        unmatched_out = unmatched_out.assign(Matched="False")
     
     # Combine dataframes
-    result = pd.concat([matched_copy, unmatched_copy], ignore_index=True)
+    result = pd.concat([matched_out, unmatched_out], ignore_index=True)
     
     # Ensure all required columns exist
     for col in required_columns:
@@ -1147,8 +1524,8 @@ def main():
         if not statements_dfs:
             raise ValueError("No statement files found")
         
-        # Combine all statement DataFrames
-        statements_df = pd.concat(statements_dfs, ignore_index=True)
+        # Combine all statement DataFrames, reusing the per-file blocks
+        statements_df = pd.concat(statements_dfs, ignore_index=True, copy=False)
         
         # Reconcile transactions
         matched_df, unmatched_df = reconcile_transactions(aggregator_df, [statements_df])
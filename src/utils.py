@@ -27,8 +27,8 @@ def setup_logging(debug=False, log_level='info'):
     
     # Create log directory if needed
     log_dir = os.path.dirname(log_file)
-    if log_dir and not os.path.exists(log_dir):
-        os.makedirs(log_dir, exist_ok=True)
+    if log_dir:
+        pathlib.Path(log_dir).mkdir(parents=True, exist_ok=True)
     
     # Set up logging to file and console
     logging.basicConfig(
@@ -75,7 +75,7 @@ empower_sample_data = {
     'Amount': ['-123.45', '-45.67']  # Negative for debits
 }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def create_test_df():
     """Helper fixture to create test DataFrames with standardized format"""
     def _create_df(format_name):
@@ -94,7 +94,7 @@ def create_test_df():
         return pd.DataFrame(sample_data[format_name])
     return _create_df
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_standardized_df():
     """Sample standardized transaction data after processing."""
     return pd.DataFrame({
@@ -106,7 +106,7 @@ def sample_standardized_df():
         'source_file': ['capital_one', 'chase']
     })
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transactions_df():
     """Sample transactions DataFrame for testing reconciliation scenarios.
     
@@ -173,7 +173,7 @@ def sample_transactions_df():
         'Matched': ["True"] * 5 + ["False"] * 3
     })
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_matched_df():
     """Sample matched transactions DataFrame."""
     return pd.DataFrame({
@@ -221,7 +221,7 @@ def sample_matched_df():
         ]
     })
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_unmatched_df():
     """Sample unmatched transactions DataFrame."""
     return pd.DataFrame({
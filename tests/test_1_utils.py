@@ -2,7 +2,8 @@ import pytest
 import pandas as pd
 import numpy as np
 import os
-from src.reconcile import standardize_date, clean_amount
+from datetime import datetime
+from src.reconcile import standardize_date, clean_amount, clean_amounts, parse_dates
 from src.utils import ensure_directory, create_output_directories
 import logging
 
@@ -19,6 +20,28 @@ def create_test_date_data():
         'invalid': 'invalid'
     }
 
+# (raw value, expected YYYY-MM-DD) for every accepted date layout
+VALID_DATE_CASES = [
+    ('2025-03-17', '2025-03-17'),
+    ('03/17/2025', '2025-03-17'),
+    ('3/17/2025', '2025-03-17'),
+    ('03-17-2025', '2025-03-17'),
+    ('2025-03-17 14:30:00', '2025-03-17'),
+    ('3/17/25', '2025-03-17'),
+    (' "2025-03-17" ', '2025-03-17'),
+]
+
+# (raw value, expected error message) for rejected dates
+INVALID_DATE_CASES = [
+    ('invalid', 'Invalid date format'),
+    ('20250317', 'Invalid date format'),
+    ('2025-02-30', 'Invalid date format'),
+    ('1800-01-01', 'Invalid date format'),
+    ('', 'Invalid date format'),
+    (None, 'Date cannot be null'),
+    (datetime(2025, 3, 17), 'Date must be a string'),
+]
+
 def create_test_amount_data():
     """Create standardized test data for amount cleaning.
     
@@ -83,6 +106,22 @@ class TestDateStandardization:
         with pytest.raises(ValueError, match="Invalid date format"):
             standardize_date(data['invalid'])
 
+@pytest.mark.parametrize("raw, expected", VALID_DATE_CASES)
+def test_parse_dates_valid(raw, expected):
+    """Test that column parsing agrees with standardize_date for each layout"""
+    assert standardize_date(raw) == expected
+    assert parse_dates(pd.Series([raw])).dt.strftime('%Y-%m-%d').iloc[0] == expected
+
+@pytest.mark.parametrize("raw, message", INVALID_DATE_CASES)
+def test_parse_dates_invalid(raw, message):
+    """Test that column parsing reports the same errors as standardize_date"""
+    with pytest.raises(ValueError, match=message):
+        standardize_date(raw)
+    with pytest.raises(ValueError, match=message):
+        parse_dates(pd.Series(['2025-03-17', raw]))
+    with pytest.raises(ValueError, match=message):
+        parse_dates(pd.Series([raw], dtype=object))
+
 @pytest.mark.dependency()
 class TestAmountCleaning:
     """Test suite for amount cleaning functionality.
@@ -131,11 +170,11 @@ class TestAmountCleaning:
         - None raises ValueError
         """
         data = create_test_amount_data()
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="Invalid amount format"):
             clean_amount(data['invalid'])
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="None or empty string"):
             clean_amount('')
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="None or empty string"):
             clean_amount(None)
         
     @pytest.mark.dependency(depends=["TestAmountCleaning::test_positive_amounts"])
@@ -152,6 +191,15 @@ class TestAmountCleaning:
         assert clean_amount(data['zero_integer']) == 0.0
         assert clean_amount(data['zero_padded']) == 0.0
 
+def test_clean_amounts_object_numbers():
+    """Test that numbers in an object column are cleaned like the scalar path"""
+    amounts = pd.Series([40.33, -12, 0.0], dtype=object)
+    assert clean_amounts(amounts).tolist() == [40.33, -12.0, 0.0]
+    assert clean_amounts(amounts).dtype == np.float64
+    
+    # Text mixed with numbers is still parsed column-wise
+    assert clean_amounts(pd.Series(['$1,234.50', 2.5], dtype=object)).tolist() == [1234.5, 2.5]
+
 @pytest.mark.dependency()
 class TestDirectoryOperations:
     """Test suite for directory operations.
@@ -179,9 +227,29 @@ class TestDirectoryOperations:
         assert os.path.isdir(logs_dir)
         
         # Test invalid directory type
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="Invalid directory type"):
             ensure_directory("invalid")
     
+    @pytest.mark.dependency(depends=["TestDirectoryOperations::test_ensure_directory"])
+    def test_ensure_directory_recreates(self, tmp_path, monkeypatch):
+        """Test that directories are created again after removal or a cwd change.
+        
+        Verifies:
+        - A deleted directory is recreated on the next call
+        - A relative DATA_DIR follows the working directory
+        """
+        monkeypatch.setenv('DATA_DIR', str(tmp_path))
+        logs_dir = ensure_directory("logs")
+        os.rmdir(logs_dir)
+        assert os.path.isdir(ensure_directory("logs"))
+        
+        monkeypatch.setenv('DATA_DIR', 'data_root')
+        for name in ['first', 'second']:
+            (tmp_path / name).mkdir()
+            monkeypatch.chdir(tmp_path / name)
+            ensure_directory("output")
+            assert (tmp_path / name / 'data_root' / 'output').is_dir()
+    
     @pytest.mark.dependency(depends=["TestDirectoryOperations::test_ensure_directory"])
     def test_create_output_directories(self, tmp_path):
         """Test output directory creation.
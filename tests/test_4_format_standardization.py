@@ -88,6 +88,12 @@ def create_test_df(format_name):
     else:
         raise ValueError(f"Unsupported format: {format_name}")
 
+@pytest.fixture(scope="module")
+def format_dfs():
+    """Raw test DataFrames for each format, built once and shared read-only"""
+    formats = ['discover', 'amex', 'capital_one', 'alliant_visa', 'chase', 'aggregator']
+    return {format_name: create_test_df(format_name) for format_name in formats}
+
 @pytest.mark.dependency()
 class TestDiscoverFormat:
     """Test suite for Discover format processing.
@@ -99,7 +105,7 @@ class TestDiscoverFormat:
     """
     
     @pytest.mark.dependency()
-    def test_basic_processing(self):
+    def test_basic_processing(self, format_dfs):
         """Test basic Discover format processing.
         
         Verifies:
@@ -108,7 +114,7 @@ class TestDiscoverFormat:
         - Description preservation
         - Category preservation
         """
-        df = create_test_df('discover')
+        df = format_dfs['discover']
         result = process_discover_format(df)
         
         assert result['Transaction Date'].iloc[0] == '2025-03-17'
@@ -118,14 +124,14 @@ class TestDiscoverFormat:
         assert result['Category'].iloc[0] == 'Shopping'
     
     @pytest.mark.dependency(depends=["TestDiscoverFormat::test_basic_processing"])
-    def test_amount_handling(self):
+    def test_amount_handling(self, format_dfs):
         """Test Discover amount handling.
         
         Verifies:
         - Debit amounts are negative
         - Credit amounts are positive
         """
-        df = create_test_df('discover')
+        df = format_dfs['discover']
         result = process_discover_format(df)
         assert result['Amount'].iloc[0] == -40.33  # Debit amount should be negative
 
@@ -140,7 +146,7 @@ class TestAmexFormat:
     """
     
     @pytest.mark.dependency()
-    def test_basic_processing(self):
+    def test_basic_processing(self, format_dfs):
         """Test basic Amex format processing.
         
         Verifies:
@@ -149,7 +155,7 @@ class TestAmexFormat:
         - Description preservation
         - Category preservation
         """
-        df = create_test_df('amex')
+        df = format_dfs['amex']
         result = process_amex_format(df)
         
         assert result['Transaction Date'].iloc[0] == '2025-03-17'
@@ -159,14 +165,14 @@ class TestAmexFormat:
         assert result['Category'].iloc[0] == 'Shopping'
     
     @pytest.mark.dependency(depends=["TestAmexFormat::test_basic_processing"])
-    def test_amount_handling(self):
+    def test_amount_handling(self, format_dfs):
         """Test Amex amount handling.
         
         Verifies:
         - Debit amounts are inverted to negative
         - Credit amounts are inverted to positive
         """
-        df = create_test_df('amex')
+        df = format_dfs['amex']
         result = process_amex_format(df)
         assert result['Amount'].iloc[0] == -123.45  # Debit amount should be negative after inversion
 
@@ -181,7 +187,7 @@ class TestCapitalOneFormat:
     """
     
     @pytest.mark.dependency()
-    def test_basic_processing(self):
+    def test_basic_processing(self, format_dfs):
         """Test basic Capital One format processing.
         
         Verifies:
@@ -190,7 +196,7 @@ class TestCapitalOneFormat:
         - Description preservation
         - Category preservation
         """
-        df = create_test_df('capital_one')
+        df = format_dfs['capital_one']
         result = process_capital_one_format(df)
         
         assert result['Transaction Date'].iloc[0] == '2025-03-17'
@@ -200,26 +206,26 @@ class TestCapitalOneFormat:
         assert result['Category'].iloc[0] == 'Shopping'
     
     @pytest.mark.dependency(depends=["TestCapitalOneFormat::test_basic_processing"])
-    def test_amount_handling(self):
+    def test_amount_handling(self, format_dfs):
         """Test Capital One amount handling.
         
         Verifies:
         - Debit amounts are negative
         - Credit amounts are positive
         """
-        df = create_test_df('capital_one')
+        df = format_dfs['capital_one']
         result = process_capital_one_format(df)
         assert result['Amount'].iloc[0] == -40.33  # Debit amount should be negative
         
     @pytest.mark.dependency(depends=["TestCapitalOneFormat::test_amount_handling"])
-    def test_credit_handling(self):
+    def test_credit_handling(self, format_dfs):
         """Test Capital One credit handling.
         
         Verifies:
         - Credit amounts are processed as positive values
         - Null debit values don't affect credit processing
         """
-        df = create_test_df('capital_one')
+        df = format_dfs['capital_one']
         result = process_capital_one_format(df)
         assert result['Amount'].iloc[1] == 100.00  # Credit amount should be positive
 
@@ -234,7 +240,7 @@ class TestAlliantFormat:
     """
     
     @pytest.mark.dependency()
-    def test_basic_processing(self):
+    def test_basic_processing(self, format_dfs):
         """Test basic Alliant format processing.
         
         Verifies:
@@ -243,7 +249,7 @@ class TestAlliantFormat:
         - Description preservation
         - Category preservation
         """
-        df = create_test_df('alliant_visa')
+        df = format_dfs['alliant_visa']
         result = process_alliant_visa_format(df)
         
         assert result['Transaction Date'].iloc[0] == '2025-03-17'
@@ -253,14 +259,14 @@ class TestAlliantFormat:
         assert result['Category'].iloc[0] == 'Shopping'
     
     @pytest.mark.dependency(depends=["TestAlliantFormat::test_basic_processing"])
-    def test_amount_handling(self):
+    def test_amount_handling(self, format_dfs):
         """Test Alliant amount handling.
         
         Verifies:
         - Debit amounts are negative
         - Credit amounts are positive
         """
-        df = create_test_df('alliant_visa')
+        df = format_dfs['alliant_visa']
         result = process_alliant_visa_format(df)
         assert result['Amount'].iloc[0] == -123.45  # Debit amount should be negative
         
@@ -303,7 +309,7 @@ class TestChaseFormat:
     """Test cases for Chase format standardization."""
 
     @pytest.mark.dependency()
-    def test_basic_processing(self):
+    def test_basic_processing(self, format_dfs):
         """Test basic Chase format processing.
 
         Verifies:
@@ -313,7 +319,7 @@ class TestChaseFormat:
         - Type field is preserved separately from Category
         - Category is set to "Uncategorized" as Chase has no category data
         """
-        df = create_test_df('chase')
+        df = format_dfs['chase']
         result = process_chase_format(df)
 
         assert result['Transaction Date'].iloc[0] == '2025-03-17'
@@ -326,14 +332,14 @@ class TestChaseFormat:
         assert result['Category'].iloc[0] == 'Uncategorized'  # Category should be "Uncategorized" not Type
 
     @pytest.mark.dependency(depends=["TestChaseFormat::test_basic_processing"])
-    def test_amount_handling(self):
+    def test_amount_handling(self, format_dfs):
         """Test Chase amount handling.
         
         Verifies:
         - Debit amounts are negative
         - Credit amounts are positive
         """
-        df = create_test_df('chase')
+        df = format_dfs['chase']
         result = process_chase_format(df)
         assert result['Amount'].iloc[0] == -40.33  # Debit amount should be negative
 
@@ -348,7 +354,7 @@ class TestAggregatorFormat:
     """
     
     @pytest.mark.dependency()
-    def test_basic_processing(self):
+    def test_basic_processing(self, format_dfs):
         """Test basic Aggregator format processing.
         
         Verifies:
@@ -358,7 +364,7 @@ class TestAggregatorFormat:
         - Category preservation
         - Additional metadata preservation
         """
-        df = create_test_df('aggregator')
+        df = format_dfs['aggregator']
         result = process_aggregator_format(df)
         
         assert result['Transaction Date'].iloc[0] == '2025-03-17'
@@ -370,13 +376,13 @@ class TestAggregatorFormat:
         assert result['Account'].iloc[0] == 'Discover Card'
     
     @pytest.mark.dependency(depends=["TestAggregatorFormat::test_basic_processing"])
-    def test_amount_handling(self):
+    def test_amount_handling(self, format_dfs):
         """Test Aggregator amount handling.
         
         Verifies:
         - Amounts are preserved exactly as input
         """
-        df = create_test_df('aggregator')
+        df = format_dfs['aggregator']
         result = process_aggregator_format(df)
         assert result['Amount'].iloc[0] == -123.45  # Amount should be preserved exactly
 
@@ -405,7 +411,7 @@ class TestStandardization:
         """
         assert standardize_date('03/17/2025') == '2025-03-17'
         assert standardize_date('2025-03-17') == '2025-03-17'
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="Invalid date format"):
             standardize_date('invalid')
 
 @pytest.mark.dependency(depends=["TestStandardization::test_date_standardization"])
@@ -537,4 +543,23 @@ class TestDescriptionStandardization:
         })
         
         result = process_alliant_checking_format(df)
-        assert result['Description'].iloc[0] == 'AMAZON.COM' 
\ No newline at end of file
+        assert result['Description'].iloc[0] == 'AMAZON.COM' 
+
+    @pytest.mark.dependency(depends=["TestDescriptionStandardization::test_no_newlines"])
+    def test_null_descriptions(self):
+        """Test handling of missing descriptions alongside text.
+        
+        Verifies:
+        - Null descriptions pass through unchanged
+        - Other rows still have newlines replaced
+        """
+        df = pd.DataFrame({
+            'Date': ['03/17/2025', '03/18/2025'],
+            'Description': [None, 'DIVIDEND\nPAYMENT'],
+            'Amount': ['$123.45', '$10.00'],
+            'Balance': ['$1,000.00', '$1,010.00']
+        })
+        
+        result = process_alliant_checking_format(df)
+        assert result['Description'].iloc[0] is None
+        assert result['Description'].iloc[1] == 'DIVIDEND PAYMENT'
@@ -7,6 +7,8 @@ import logging
 import re
 from src.reconcile import (
     reconcile_transactions,
+    match_key_codes,
+    encode_key_pairs,
     import_csv,
     import_folder,
     ensure_directory,
@@ -15,6 +17,25 @@ from src.reconcile import (
     process_chase_format
 )
 
+RECONCILED_COLUMNS = frozenset([
+    'Transaction Date', 'Post Date', 'Description', 'Amount', 'Category',
+    'source_file', 'Date', 'YearMonth', 'Account', 'Tags', 'reconciled_key', 'Matched'
+])
+
+RECONCILED_DTYPES = {
+    'Transaction Date': np.dtype('datetime64[ns]'),
+    'Post Date': np.dtype('datetime64[ns]'),
+    'Date': np.dtype('datetime64[ns]'),
+    'Amount': np.dtype('float64'),
+    'Description': np.dtype('O'),
+    'Category': np.dtype('O'),
+    'source_file': np.dtype('O'),
+    'Account': np.dtype('O'),
+    'Tags': np.dtype('O'),
+    'reconciled_key': np.dtype('O'),
+    'Matched': np.dtype(bool)
+}
+
 def create_test_df(name, num_records=1, with_dates=False):
     """Helper function to create test DataFrames with standardized format"""
     if with_dates:
@@ -34,7 +55,7 @@ def create_test_df(name, num_records=1, with_dates=False):
     }
     return pd.DataFrame(data)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_discover_df():
     """Create a sample Discover DataFrame"""
     return pd.DataFrame({
@@ -45,7 +66,7 @@ def sample_discover_df():
         'Category': ['Shopping']
     })
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_capital_one_df():
     """Create a sample Capital One DataFrame"""
     return pd.DataFrame({
@@ -58,7 +79,7 @@ def sample_capital_one_df():
         'Credit': ['']
     })
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_chase_df():
     """Create a sample Chase DataFrame"""
     return pd.DataFrame({
@@ -71,7 +92,7 @@ def sample_chase_df():
         'Check or Slip #': ['']
     })
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_aggregator_df():
     """Create a sample aggregator DataFrame"""
     return pd.DataFrame({
@@ -83,7 +104,18 @@ def sample_aggregator_df():
         'source_file': ['aggregator.csv']
     })
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def single_transaction_df():
+    """One standardized transaction, shared read-only by the matching tests"""
+    return pd.DataFrame({
+        'Transaction Date': ['2025-01-01'],
+        'Post Date': ['2025-01-02'],
+        'Description': ['test transaction'],
+        'Amount': [-50.00],
+        'Category': ['shopping']
+    })
+
+@pytest.fixture(scope="module")
 def sample_matched_df():
     """Create a sample DataFrame of matched transactions"""
     return pd.DataFrame({
@@ -101,7 +133,7 @@ def sample_matched_df():
         'Matched': [True, True]
     })
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_unmatched_df():
     """Create a sample DataFrame of unmatched transactions"""
     return pd.DataFrame({
@@ -154,7 +186,7 @@ def test_ensure_directory(tmp_path, monkeypatch):
     assert os.path.isdir(logs_dir)
     
     # Test invalid directory type
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="Invalid directory type"):
         ensure_directory('invalid')
 
 def test_import_csv(tmp_path):
@@ -191,25 +223,10 @@ def test_import_folder(tmp_path):
 class TestReconciliation:
     """Test suite for transaction reconciliation"""
     
-    def test_basic_matching(self):
+    def test_basic_matching(self, single_transaction_df):
         """Test basic transaction matching"""
-        aggregator_df = pd.DataFrame({
-            'Transaction Date': ['2025-01-01'],
-            'Post Date': ['2025-01-02'],
-            'Description': ['test transaction'],
-            'Amount': [-50.00],
-            'Category': ['shopping'],
-            'Account': ['Test Account']
-        })
-        
-        detail_df = pd.DataFrame({
-            'Transaction Date': ['2025-01-01'],
-            'Post Date': ['2025-01-02'],
-            'Description': ['test transaction'],
-            'Amount': [-50.00],
-            'Category': ['shopping'],
-            'source_file': ['test_target.csv']
-        })
+        aggregator_df = single_transaction_df.assign(Account='Test Account')
+        detail_df = single_transaction_df.assign(source_file='test_target.csv')
         
         # Use aggregator as first argument, detail as second argument
         matches, unmatched = reconcile_transactions(aggregator_df, [detail_df])
@@ -241,15 +258,9 @@ class TestReconciliation:
         assert len(matches) == 2
         assert len(unmatched) == 0
     
-    def test_unmatched_transactions(self):
+    def test_unmatched_transactions(self, single_transaction_df):
         """Test handling of unmatched transactions"""
-        source_df = pd.DataFrame({
-            'Transaction Date': ['2025-01-01'],
-            'Post Date': ['2025-01-02'],
-            'Description': ['test transaction'],
-            'Amount': [-50.00],
-            'Category': ['shopping']
-        })
+        source_df = single_transaction_df
         
         target_df = pd.DataFrame({
             'Transaction Date': ['2025-01-03'],
@@ -262,8 +273,12 @@ class TestReconciliation:
         matches, unmatched = reconcile_transactions(source_df, [target_df])
         assert len(matches) == 0
         assert len(unmatched) == 2
+        
+        # Key output fields must be populated (checked in a single pass)
+        key_fields = unmatched[['Transaction Date', 'YearMonth', 'Amount', 'reconciled_key', 'Matched']]
+        assert not key_fields.isna().to_numpy().any()
     
-    def test_duplicate_handling(self):
+    def test_duplicate_handling(self, single_transaction_df):
         """Test handling of duplicate transactions"""
         aggregator_df = pd.DataFrame({
             'Transaction Date': ['2025-01-01', '2025-01-01'],
@@ -274,59 +289,29 @@ class TestReconciliation:
             'Account': ['Test Account', 'Test Account']
         })
         
-        detail_df = pd.DataFrame({
-            'Transaction Date': ['2025-01-01'],
-            'Post Date': ['2025-01-02'],
-            'Description': ['test transaction'],
-            'Amount': [-50.00],
-            'Category': ['shopping'],
-            'source_file': ['test_target.csv']
-        })
+        detail_df = single_transaction_df.assign(source_file='test_target.csv')
         
         # Use aggregator as first argument, detail as second argument
         matches, unmatched = reconcile_transactions(aggregator_df, [detail_df])
         assert len(matches) == 1
         assert len(unmatched) == 1
     
-    def test_date_matching(self):
+    def test_date_matching(self, single_transaction_df):
         """Test date-based matching"""
-        source_df = pd.DataFrame({
-            'Transaction Date': ['2025-01-01'],
-            'Post Date': ['2025-01-02'],
-            'Description': ['test transaction'],
-            'Amount': [-50.00],
-            'Category': ['shopping']
-        })
-        
-        target_df = pd.DataFrame({
-            'Transaction Date': ['2025-01-02'],  # Different date
-            'Post Date': ['2025-01-03'],
-            'Description': ['test transaction'],
-            'Amount': [-50.00],
-            'Category': ['shopping']
+        source_df = single_transaction_df
+        target_df = single_transaction_df.assign(**{
+            'Transaction Date': '2025-01-02',  # Different date
+            'Post Date': '2025-01-03'
         })
         
         matches, unmatched = reconcile_transactions(source_df, [target_df])
         assert len(matches) == 0
         assert len(unmatched) == 2
     
-    def test_amount_matching(self):
+    def test_amount_matching(self, single_transaction_df):
         """Test amount-based matching"""
-        source_df = pd.DataFrame({
-            'Transaction Date': ['2025-01-01'],
-            'Post Date': ['2025-01-02'],
-            'Description': ['test transaction'],
-            'Amount': [-50.00],
-            'Category': ['shopping']
-        })
-        
-        target_df = pd.DataFrame({
-            'Transaction Date': ['2025-01-01'],
-            'Post Date': ['2025-01-02'],
-            'Description': ['test transaction'],
-            'Amount': [-75.00],  # Different amount
-            'Category': ['shopping']
-        })
+        source_df = single_transaction_df
+        target_df = single_transaction_df.assign(Amount=-75.00)  # Different amount
         
         matches, unmatched = reconcile_transactions(source_df, [target_df])
         assert len(matches) == 0
@@ -336,28 +321,14 @@ class TestReconciliation:
         """Test the format of reconciled output"""
         # Test matched transactions format
         assert not sample_matched_df.empty
-        required_columns = [
-            'Transaction Date', 'Post Date', 'Description', 'Amount', 'Category',
-            'source_file', 'Date', 'YearMonth', 'Account', 'Tags', 'reconciled_key', 'Matched'
-        ]
-        assert all(col in sample_matched_df.columns for col in required_columns)
+        assert RECONCILED_COLUMNS.issubset(sample_matched_df.columns)
         
         # Test unmatched transactions format
         assert not sample_unmatched_df.empty
-        assert all(col in sample_unmatched_df.columns for col in required_columns)
+        assert RECONCILED_COLUMNS.issubset(sample_unmatched_df.columns)
         
         # Test data types
-        assert pd.api.types.is_datetime64_any_dtype(sample_matched_df['Transaction Date'])
-        assert pd.api.types.is_datetime64_any_dtype(sample_matched_df['Post Date'])
-        assert pd.api.types.is_datetime64_any_dtype(sample_matched_df['Date'])
-        assert pd.api.types.is_float_dtype(sample_matched_df['Amount'])
-        assert pd.api.types.is_string_dtype(sample_matched_df['Description'])
-        assert pd.api.types.is_string_dtype(sample_matched_df['Category'])
-        assert pd.api.types.is_string_dtype(sample_matched_df['source_file'])
-        assert pd.api.types.is_string_dtype(sample_matched_df['Account'])
-        assert pd.api.types.is_string_dtype(sample_matched_df['Tags'])
-        assert pd.api.types.is_string_dtype(sample_matched_df['reconciled_key'])
-        assert pd.api.types.is_bool_dtype(sample_matched_df['Matched'])
+        assert sample_matched_df.dtypes[list(RECONCILED_DTYPES)].to_dict() == RECONCILED_DTYPES
 
     def test_reconciled_key_format(self):
         """Test that reconciled keys are in the correct format"""
@@ -413,6 +384,11 @@ class TestReconciliation:
         source_unmatched = unmatched[unmatched['Account'].str.contains('Test Account')]
         assert not source_unmatched.empty, "No source unmatched records found"
         assert source_unmatched['reconciled_key'].iloc[0].startswith('U:'), f"Expected key to start with U: but got {source_unmatched['reconciled_key'].iloc[0]}"
+        
+        # Split and validate every unmatched key in a single regex pass
+        key_parts = unmatched['reconciled_key'].str.extract(r'^U:(?P<date>\d{4}-\d{2}-\d{2})_(?P<amount>\d+\.\d{2})$')
+        assert not key_parts.isna().to_numpy().any(), f"Malformed unmatched keys: {unmatched['reconciled_key'].tolist()}"
+        assert (key_parts['amount'].astype(float) == unmatched['Amount'].abs()).all()
 
     def test_tag_preservation(self):
         """Test that tags from aggregator are preserved in reconciliation output.
@@ -432,16 +408,15 @@ class TestReconciliation:
         # Check matched records
         assert not matches_df.empty, "No matches found between aggregator and detail records"
         assert 'Tags' in matches_df.columns
-        assert len(matches_df['Tags'].tolist()) == 3, f"Expected 3 tags but got {len(matches_df['Tags'].tolist())}"
-        assert set(matches_df['Tags'].tolist()) == set(['Online', 'Subscription', 'Groceries']), f"Tags don't match expected values"
+        assert len(matches_df) == 3, f"Expected 3 tags but got {len(matches_df)}"
+        assert set(matches_df['Tags']) == {'Online', 'Subscription', 'Groceries'}, f"Tags don't match expected values"
         
         # Check unmatched records (should be empty in this case since all records match)
         assert unmatched_df.empty, "Expected no unmatched records"
 
         # Test with mismatched data to verify unmatched behavior
-        detail_df_modified = detail_df.copy()
         # Change amounts to force unmatched
-        detail_df_modified['Amount'] = [-41.33, -14.99, -51.00]  
+        detail_df_modified = detail_df.assign(Amount=[-41.33, -14.99, -51.00])
         
         # Run reconciliation with modified data
         matches_df, unmatched_df = reconcile_transactions(aggregator_df, [detail_df_modified])
@@ -457,14 +432,14 @@ class TestReconciliation:
         assert not aggregator_unmatched.empty, "No unmatched aggregator records found"
         
         # Check tags preserved in unmatched aggregator records
-        assert set(aggregator_unmatched['Tags'].tolist()) == set(['Online', 'Subscription', 'Groceries']), "Tags not preserved in unmatched aggregator records"
+        assert set(aggregator_unmatched['Tags']) == {'Online', 'Subscription', 'Groceries'}, "Tags not preserved in unmatched aggregator records"
         
         # Check unmatched detail records
         detail_unmatched = unmatched_df[unmatched_df['Account'].str.contains('discover')]
         assert not detail_unmatched.empty, "No unmatched detail records found"
         
         # Check empty tags in unmatched detail records
-        assert all(tag == '' for tag in detail_unmatched['Tags']), "Expected empty tags in unmatched detail records"
+        assert (detail_unmatched['Tags'] == '').all(), "Expected empty tags in unmatched detail records"
 
     def test_aggregator_field_precedence(self):
         """Test that aggregator fields take precedence over detail fields for matched transactions.
@@ -523,9 +498,8 @@ class TestReconciliation:
         assert matches_df['Tags'].iloc[0] == 'Aggregator Tag', f"Expected 'Aggregator Tag' but got {matches_df['Tags'].iloc[0]}"
         
         # Test with null fields in aggregator
-        aggregator_df_null = aggregator_df.copy()
-        aggregator_df_null['Category'] = None  # Null category in aggregator
-        aggregator_df_null['Description'] = None  # Null description in aggregator
+        # Null category and description in aggregator
+        aggregator_df_null = aggregator_df.assign(Category=None, Description=None)
         
         matches_df, unmatched_df = reconcile_transactions(aggregator_df_null, [detail_df])
         
@@ -534,28 +508,40 @@ class TestReconciliation:
         assert matches_df['Description'].iloc[0] == 'AMAZON DETAIL DESC', f"Expected 'AMAZON DETAIL DESC' but got {matches_df['Description'].iloc[0]}"
         assert matches_df['Category'].iloc[0] == 'Detail Category', f"Expected 'Detail Category' but got {matches_df['Category'].iloc[0]}"
 
-def test_calculate_discrepancies():
+def test_calculate_discrepancies(single_transaction_df):
     """Test the calculate_discrepancies function"""
-    source_df = pd.DataFrame({
-        'Transaction Date': ['2025-01-01'],
-        'Post Date': ['2025-01-02'],
-        'Description': ['test transaction'],
-        'Amount': [-50.00],
-        'Category': ['shopping']
-    })
-    
-    target_df = pd.DataFrame({
-        'Transaction Date': ['2025-01-01'],
-        'Post Date': ['2025-01-02'],
-        'Description': ['test transaction'],
-        'Amount': [-75.00],  # Different amount
-        'Category': ['shopping']
-    })
+    source_df = single_transaction_df
+    target_df = single_transaction_df.assign(Amount=-75.00)  # Different amount
     
     matches, unmatched = reconcile_transactions(source_df, [target_df])
     assert len(matches) == 0  # Should not match due to different amounts
     assert len(unmatched) == 2  # Both transactions should be unmatched 
 
+def test_match_key_codes():
+    """Test greedy matching over integer key codes"""
+    # Code 0 owns entries 0-1 (groups 0 and 1), code 1 owns entry 2 (group 0)
+    entry_starts = [0, 2, 3]
+    entry_groups = [0, 1, 0]
+    
+    matched_entries, group_matched = match_key_codes(
+        [(0,), (1, 0), (0,), (-1,)], entry_starts, entry_groups, 2
+    )
+    
+    # Row 1 falls back to code 0 because group 0 was already used by row 0
+    assert matched_entries == [0, 1, -1, -1]
+    assert group_matched == [True, True]
+
+def test_encode_key_pairs():
+    """Test that (date, amount) key pairs encode to equal codes only when both parts match"""
+    agg_codes, detail_codes = encode_key_pairs(
+        [np.array(['2025-01-02', '2025-01-02']), np.array(['2025-01-02', '2025-01-03', '2025-01-02'])],
+        [np.array(['42.80', '10.00']), np.array(['42.80', '42.80', 'nan'])]
+    )
+    
+    assert len(agg_codes) == 2 and len(detail_codes) == 3
+    assert agg_codes[0] == detail_codes[0]
+    assert len(set(detail_codes.tolist()) | {agg_codes[1]}) == 4
+
 def create_test_aggregator_data():
     """Create test data for aggregator format."""
     return pd.DataFrame({
@@ -15,11 +15,22 @@ from src.reconcile import (
 )
 from src.utils import setup_logging
 
+# Output format (column order as written by save_reconciliation_results)
+OUTPUT_COLUMN_ORDER = (
+    'Date', 'YearMonth', 'Account', 'Description', 'Category',
+    'Tags', 'Amount', 'reconciled_key', 'Matched'
+)
+OUTPUT_COLUMNS = frozenset(OUTPUT_COLUMN_ORDER)
+YEAR_MONTH_PATTERN = re.compile(r'^\d{4}-\d{2}$')
+RECONCILED_KEY_PATTERN = re.compile(r'^[PTU]:\d{4}-\d{2}-\d{2}_\d+\.\d{2}$')
+ACCOUNT_PATTERN = re.compile(r'^(Matched|Unreconciled) - ')
+
 def create_test_df(name, num_records=3):
     """Helper function to create test DataFrames with standardized format"""
+    dates = [f'2025-03-{i+17}' for i in range(num_records)]
     data = {
-        'Transaction Date': [f'2025-03-{i+17}' for i in range(num_records)],
-        'Post Date': [f'2025-03-{i+17}' for i in range(num_records)],
+        'Transaction Date': dates,
+        'Post Date': dates,
         'Description': [f'TEST TRANSACTION {i+1}' for i in range(num_records)],
         'Amount': [-123.45 * (i+1) for i in range(num_records)],
         'Category': ['Shopping'] * num_records,
@@ -27,7 +38,7 @@ def create_test_df(name, num_records=3):
     }
     return pd.DataFrame(data)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_discover_df():
     """Create a sample Discover DataFrame"""
     return pd.DataFrame({
@@ -38,7 +49,7 @@ def sample_discover_df():
         'Category': ['Shopping']
     })
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_capital_one_df():
     """Create a sample Capital One DataFrame"""
     return pd.DataFrame({
@@ -51,7 +62,7 @@ def sample_capital_one_df():
         'Credit': ['']
     })
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_chase_df():
     """Create a sample Chase DataFrame"""
     return pd.DataFrame({
@@ -64,7 +75,7 @@ def sample_chase_df():
         'Check or Slip #': ['']
     })
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_aggregator_df():
     """Create a sample aggregator DataFrame"""
     return pd.DataFrame({
@@ -76,7 +87,7 @@ def sample_aggregator_df():
         'source_file': ['aggregator.csv']
     })
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_matched_df():
     """Create a sample DataFrame of matched transactions"""
     return pd.DataFrame({
@@ -94,7 +105,7 @@ def sample_matched_df():
         'Matched': [True, True]
     })
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_unmatched_df():
     """Create a sample DataFrame of unmatched transactions"""
     return pd.DataFrame({
@@ -296,7 +307,7 @@ def test_report_validation():
     })
     
     # Should raise ValueError for missing required columns
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="Missing required columns in matched_df"):
         generate_reconciliation_report(matches, pd.DataFrame(), "report.txt")
 
 def test_empty_results_handling(tmp_path):
@@ -320,26 +331,15 @@ def test_empty_results_handling(tmp_path):
 def test_output_format_validation(sample_transactions_df):
     """Test that output format follows specifications."""
     # Test required columns
-    required_columns = [
-        'Date',
-        'YearMonth',
-        'Account',
-        'Description',
-        'Category',
-        'Tags',
-        'Amount',
-        'reconciled_key',
-        'Matched'
-    ]
-    assert all(col in sample_transactions_df.columns for col in required_columns), \
-        f"Missing required columns in output. Expected: {required_columns}, Got: {sample_transactions_df.columns.tolist()}"
+    assert OUTPUT_COLUMNS.issubset(sample_transactions_df.columns), \
+        f"Missing required columns in output. Expected: {sorted(OUTPUT_COLUMNS)}, Got: {sample_transactions_df.columns.tolist()}"
 
     # Test date formats
     assert pd.to_datetime(sample_transactions_df['Date']).dt.strftime('%Y-%m-%d').equals(sample_transactions_df['Date']), \
         "Date must be in YYYY-MM-DD format"
     
     # Test YearMonth format
-    assert sample_transactions_df['YearMonth'].str.match(r'^\d{4}-\d{2}$').all(), \
+    assert sample_transactions_df['YearMonth'].str.match(YEAR_MONTH_PATTERN).all(), \
         "YearMonth must be in YYYY-MM format"
 
     # Test amount format
@@ -351,11 +351,11 @@ def test_output_format_validation(sample_transactions_df):
         "Matched should be either 'True' or 'False'"
 
     # Test reconciled_key format
-    assert sample_transactions_df['reconciled_key'].str.match(r'^[PTU]:\d{4}-\d{2}-\d{2}_\d+\.\d{2}$').all(), \
+    assert sample_transactions_df['reconciled_key'].str.match(RECONCILED_KEY_PATTERN).all(), \
         "reconciled_key must be in format {prefix}:{date}_{amount} where prefix is P, T, or U"
 
     # Test Account format
-    assert all(acc.startswith(('Matched - ', 'Unreconciled - ')) for acc in sample_transactions_df['Account']), \
+    assert sample_transactions_df['Account'].str.match(ACCOUNT_PATTERN).all(), \
         "Account must start with 'Matched - ' or 'Unreconciled - '"
 
 def test_report_generation_with_matched_and_unmatched(sample_matched_df, sample_unmatched_df, tmp_path):
@@ -408,27 +408,29 @@ def test_save_reconciliation_results(sample_matched_df, sample_unmatched_df, tmp
     
     # Read and verify contents
     df = pd.read_csv(all_transactions_path, dtype={'Matched': str})
+    counts = df['Matched'].value_counts()
     print(f"Matched column contents: {df['Matched'].tolist()}")
-    print(f"Count of \"True\" values: {(df['Matched'] == 'True').sum()}")
-    print(f"Count of \"False\" values: {(df['Matched'] == 'False').sum()}")
+    print(f"Count of \"True\" values: {counts.get('True', 0)}")
+    print(f"Count of \"False\" values: {counts.get('False', 0)}")
     print(f"Expected matched length: {len(sample_matched_df)}")
     
-    assert 'Matched' in df.columns
+    assert tuple(df.columns) == OUTPUT_COLUMN_ORDER
     assert len(df) == len(sample_matched_df) + len(sample_unmatched_df)
-    assert (df['Matched'] == 'True').sum() == len(sample_matched_df)  # Count of "True" values should equal matches length
-    assert (df['Matched'] == 'False').sum() == len(sample_unmatched_df)  # Count of "False" values should equal unmatched length
+    assert counts.get('True', 0) == len(sample_matched_df)  # Count of "True" values should equal matches length
+    assert counts.get('False', 0) == len(sample_unmatched_df)  # Count of "False" values should equal unmatched length
     
-    # Verify data integrity
-    matched_rows = df[df['Matched'] == 'True']
-    unmatched_rows = df[df['Matched'] == 'False']
+    # Verify data integrity (split rows by match status in one pass)
+    by_status = df.groupby('Matched', sort=False)
+    matched_rows = by_status.get_group('True')
+    unmatched_rows = by_status.get_group('False')
     
     # Check matched transactions
-    assert all(matched_rows['Description'].isin(sample_matched_df['Description']))
-    assert all(matched_rows['Amount'].isin(sample_matched_df['Amount']))
+    assert matched_rows['Description'].isin(sample_matched_df['Description']).all()
+    assert matched_rows['Amount'].isin(sample_matched_df['Amount']).all()
     
     # Check unmatched transactions
-    assert all(unmatched_rows['Description'].isin(sample_unmatched_df['Description']))
-    assert all(unmatched_rows['Amount'].isin(sample_unmatched_df['Amount']))
+    assert unmatched_rows['Description'].isin(sample_unmatched_df['Description']).all()
+    assert unmatched_rows['Amount'].isin(sample_unmatched_df['Amount']).all()
 
 def test_reconciled_output_format(tmp_path):
     """Test that reconciliation results are saved in the correct format"""
@@ -475,21 +477,23 @@ def test_reconciled_output_format(tmp_path):
         
         # Read and verify contents
         df = pd.read_excel(excel_path, sheet_name='All Transactions', dtype={'Matched': str})
-        assert 'Matched' in df.columns
+        assert tuple(df.columns) == OUTPUT_COLUMN_ORDER
         assert len(df) == len(matched_df) + len(unmatched_df)
         
         # Check that we have the correct number of matched and unmatched rows
-        assert (df['Matched'] == 'True').sum() == len(matched_df)
-        assert (df['Matched'] == 'False').sum() == len(unmatched_df)
+        counts = df['Matched'].value_counts()
+        assert counts.get('True', 0) == len(matched_df)
+        assert counts.get('False', 0) == len(unmatched_df)
         
-        # Verify data integrity
-        matched_rows = df[df['Matched'] == 'True']
-        unmatched_rows = df[df['Matched'] == 'False']
+        # Verify data integrity (split rows by match status in one pass)
+        by_status = df.groupby('Matched', sort=False)
+        matched_rows = by_status.get_group('True')
+        unmatched_rows = by_status.get_group('False')
         
         # Check matched transactions
-        assert all(matched_rows['Description'].isin(matched_df['Description']))
-        assert all(matched_rows['Amount'].isin(matched_df['Amount']))
+        assert matched_rows['Description'].isin(matched_df['Description']).all()
+        assert matched_rows['Amount'].isin(matched_df['Amount']).all()
         
         # Check unmatched transactions
-        assert all(unmatched_rows['Description'].isin(unmatched_df['Description']))
-        assert all(unmatched_rows['Amount'].isin(unmatched_df['Amount'])) 
\ No newline at end of file
+        assert unmatched_rows['Description'].isin(unmatched_df['Description']).all()
+        assert unmatched_rows['Amount'].isin(unmatched_df['Amount']).all() 
\ No newline at end of file